@@ -1,243 +1,789 @@
-from __future__ import annotations
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
-from typing import List, Dict, Iterable, Optional, Tuple
-import csv
-import argparse
-
-
-# ===============================
-# Lagos Tertiary Institution Directory
-# Demonstrates: Encapsulation, Abstraction, Inheritance, Polymorphism
-# Algorithms: filtering, keyword search, multi-key sorting, composite ranking
-# ===============================
-
-# ---------- ABSTRACTION ----------
-@dataclass
-class BaseInstitution(ABC):
-    _name: str
-    _ownership: str            # "federal" | "state" | "private"
-    _lga: str                  # Lagos LGA (e.g., "Ojo", "Ikeja", "Yaba")
-    _courses: List[str]        # e.g., ["Computer Science","Mass Communication"]
-    _tuition_avg: float        # average annual tuition (₦)
-    _accreditation_score: float  # simple 0–100 scale for demo
-    _student_population: int
-
-    # ---------- ENCAPSULATION (validated properties) ----------
-    @property
-    def name(self) -> str: return self._name
-
-    @property
-    def ownership(self) -> str: return self._ownership.lower()
-
-    @property
-    def lga(self) -> str: return self._lga
-
-    @property
-    def courses(self) -> List[str]: return list(self._courses)
-
-    @property
-    def tuition_avg(self) -> float: return float(self._tuition_avg)
-
-    @property
-    def accreditation_score(self) -> float: return float(self._accreditation_score)
-
-    @property
-    def student_population(self) -> int: return int(self._student_population)
-
-    def offers_course(self, course_keyword: str) -> bool:
-        kw = course_keyword.strip().lower()
-        return any(kw in c.lower() for c in self._courses)
-
-    # Each subclass defines category label and ranking emphasis
-    @property
-    @abstractmethod
-    def category(self) -> str: ...
-
-    @abstractmethod
-    def base_rank_weights(self) -> Tuple[float, float, float]:
-        """
-        Return weights for (accreditation, affordability, size_attractiveness)
-        Affordability is inverse of tuition.
-        """
-
-    # ---------- POLYMORPHISM (per-type ranking) ----------
-    def rank_score(self) -> float:
-        w_acc, w_aff, w_size = self.base_rank_weights()
-
-        # Normalize features to 0–1
-        acc = max(0.0, min(1.0, self.accreditation_score / 100.0))
-        # For affordability, lower tuition should mean higher score.
-        # Use a soft cap to avoid division explosions.
-        aff = 1.0 / (1.0 + (self.tuition_avg / 1_000_000.0))  # ₦1m scale
-        # Size attractiveness (preference for moderate to large population)
-        size = min(1.0, self.student_population / 30_000.0)
-
-        return (w_acc * acc) + (w_aff * aff) + (w_size * size)
-
-    # Friendly one-line summary
-    def line(self) -> str:
-        return (f"{self.name} [{self.category.title()} | {self.ownership.title()} | {self.lga}] "
-                f"Accr {self.accreditation_score:.0f}/100 • Tuition ₦{self.tuition_avg:,.0f} • "
-                f"Students {self.student_population:,}")
-
-
-# ---------- INHERITANCE ----------
-class University(BaseInstitution):
-    @property
-    def category(self) -> str: return "university"
-
-    def base_rank_weights(self) -> Tuple[float, float, float]:
-        # Universities value accreditation strongly, size moderately
-        return (0.60, 0.20, 0.20)
-
-
-class Polytechnic(BaseInstitution):
-    @property
-    def category(self) -> str: return "polytechnic"
-
-    def base_rank_weights(self) -> Tuple[float, float, float]:
-        # Polytechnics value affordability a bit more (skills orientation)
-        return (0.45, 0.35, 0.20)
-
-
-class CollegeOfEducation(BaseInstitution):
-    @property
-    def category(self) -> str: return "college"
-
-    def base_rank_weights(self) -> Tuple[float, float, float]:
-        # Colleges focus on accreditation and affordability
-        return (0.50, 0.40, 0.10)
-
-
-# ---------- Directory + Algorithms ----------
-class InstitutionDirectory:
-    def __init__(self, institutions: List[BaseInstitution]):
-        self._inst = institutions
-
-    @classmethod
-    def from_csv(cls, path: str) -> "InstitutionDirectory":
-        acc: List[BaseInstitution] = []
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                category = (row["category"] or "").strip().lower()
-                name = row["name"].strip()
-                ownership = row["ownership"].strip().lower()
-                lga = row["lga"].strip()
-                courses = [c.strip() for c in (row["courses"] or "").split("|") if c.strip()]
-                tuition = float(row["tuition_avg"] or 0.0)
-                accr = float(row["accreditation_score"] or 0.0)
-                pop = int(row["student_population"] or 0)
-
-                if category == "university":
-                    obj = University(name, ownership, lga, courses, tuition, accr, pop)
-                elif category == "polytechnic":
-                    obj = Polytechnic(name, ownership, lga, courses, tuition, accr, pop)
-                elif category in ("college", "college_of_education", "college of education"):
-                    obj = CollegeOfEducation(name, ownership, lga, courses, tuition, accr, pop)
-                else:
-                    # Default to university if unspecified
-                    obj = University(name, ownership, lga, courses, tuition, accr, pop)
-                acc.append(obj)
-        return cls(acc)
-
-    # ------- Filtering & search (algorithmic) -------
-    def filter(
-        self,
-        category: Optional[str] = None,
-        ownership: Optional[str] = None,
-        lga: Optional[str] = None,
-        course_keyword: Optional[str] = None,
-        min_accreditation: Optional[float] = None,
-        max_tuition: Optional[float] = None,
-    ) -> List[BaseInstitution]:
-        res: Iterable[BaseInstitution] = self._inst
-        if category:
-            c = category.lower()
-            res = (i for i in res if i.category == c)
-        if ownership:
-            ow = ownership.lower()
-            res = (i for i in res if i.ownership == ow)
-        if lga:
-            lg = lga.lower()
-            res = (i for i in res if i.lga.lower() == lg)
-        if course_keyword:
-            res = (i for i in res if i.offers_course(course_keyword))
-        if min_accreditation is not None:
-            res = (i for i in res if i.accreditation_score >= float(min_accreditation))
-        if max_tuition is not None:
-            res = (i for i in res if i.tuition_avg <= float(max_tuition))
-        return list(res)
-
-    def sort(
-        self,
-        institutions: List[BaseInstitution],
-        by: str = "rank",
-        descending: bool = True
-    ) -> List[BaseInstitution]:
-        keyf = {
-            "rank": lambda x: x.rank_score(),
-            "tuition": lambda x: x.tuition_avg,
-            "accreditation": lambda x: x.accreditation_score,
-            "name": lambda x: x.name.lower(),
-            "population": lambda x: x.student_population
-        }.get(by, lambda x: x.rank_score())
-        return sorted(institutions, key=keyf, reverse=descending)
-
-    def top_n(self, institutions: List[BaseInstitution], n: int = 5) -> List[BaseInstitution]:
-        return institutions[:max(0, n)]
-
-    def summarize(self, institutions: List[BaseInstitution]) -> str:
-        if not institutions:
-            return "No institutions matched your criteria."
-        lines = []
-        for i, inst in enumerate(institutions, 1):
-            lines.append(f"{i:>2}. {inst.line()} • RankScore {inst.rank_score():.3f}")
-        return "\n".join(lines)
-
-
-# ---------- CLI ----------
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(description="Lagos Tertiary Institution Directory (Search & Rank)")
-    p.add_argument("--csv", type=str, default="institutions_sample.csv", help="Path to CSV dataset")
-
-    # Filters
-    p.add_argument("--category", type=str, choices=["university", "polytechnic", "college"], help="Filter by category")
-    p.add_argument("--ownership", type=str, choices=["federal", "state", "private"], help="Filter by ownership")
-    p.add_argument("--lga", type=str, help="Filter by LGA (e.g., Ojo, Yaba, Ikeja)")
-    p.add_argument("--course", type=str, help="Keyword in course name (e.g., 'Computer')")
-    p.add_argument("--min-accr", type=float, help="Minimum accreditation score (0–100)")
-    p.add_argument("--max-tuition", type=float, help="Maximum average tuition (₦)")
-
-    # Sorting & output
-    p.add_argument("--sort-by", type=str, default="rank",
-                   choices=["rank", "tuition", "accreditation", "name", "population"],
-                   help="Sort key")
-    p.add_argument("--asc", action="store_true", help="Sort ascending (default: descending)")
-    p.add_argument("--top", type=int, default=5, help="Show top N results")
-    return p
-
-
-def main():
-    args = build_parser().parse_args()
-    directory = InstitutionDirectory.from_csv(args.csv)
-
-    filtered = directory.filter(
-        category=args.category,
-        ownership=args.ownership,
-        lga=args.lga,
-        course_keyword=args.course,
-        min_accreditation=args.min_accr,
-        max_tuition=args.max_tuition
-    )
-    sorted_list = directory.sort(filtered, by=args.sort_by, descending=not args.asc)
-    top = directory.top_n(sorted_list, n=args.top)
-
-    print("\n=== Lagos Tertiary Institution Directory — Results ===\n")
-    print(directory.summarize(top))
-    print("\nTip: adjust filters, e.g., --category university --course Computer --max-tuition 400000 --sort-by accreditation --top 10\n")
-
-
-if __name__ == "__main__":
-    main()
+from __future__ import annotations
+from dataclasses import dataclass, field
+from abc import ABC
+from typing import ClassVar, List, Dict, Optional, Tuple
+import csv
+import argparse
+import heapq
+import re
+from operator import attrgetter
+
+import numpy as np
+
+try:
+    from numba import njit  # optional: JIT-compiled top-n ranking kernel
+except ImportError:
+    njit = None
+
+try:
+    import pandas as pd  # optional: C-speed CSV parsing for large files
+except ImportError:
+    pd = None
+
+
+# ===============================
+# Lagos Tertiary Institution Directory
+# Demonstrates: Encapsulation, Abstraction, Inheritance, Polymorphism
+# Algorithms: filtering, keyword search, multi-key sorting, composite ranking
+# ===============================
+
+# Category codes index both the subclass table and the rank weights.
+CAT_UNIVERSITY, CAT_POLYTECHNIC, CAT_COLLEGE = 0, 1, 2
+
+# (accreditation, affordability, size_attractiveness) per category code;
+# affordability is inverse of tuition.
+_RANK_WEIGHTS: Tuple[Tuple[float, float, float], ...] = (
+    (0.60, 0.20, 0.20),   # university: accreditation strongly, size moderately
+    (0.45, 0.35, 0.20),   # polytechnic: affordability a bit more (skills orientation)
+    (0.50, 0.40, 0.10),   # college: accreditation and affordability
+)
+
+
+# ---------- ABSTRACTION ----------
+# slots=True: no per-instance __dict__, so instances are ~half the size
+# and attribute access skips the dict lookup. Left unfrozen because row
+# indices and cached derived values are assigned after construction.
+@dataclass(slots=True)
+class BaseInstitution(ABC):
+    _name: str
+    _ownership: str            # "federal" | "state" | "private"
+    _lga: str                  # Lagos LGA (e.g., "Ojo", "Ikeja", "Yaba")
+    _courses: Tuple[str, ...]  # e.g., ("Computer Science","Mass Communication")
+    _tuition_avg: float        # average annual tuition (₦)
+    _accreditation_score: float  # simple 0–100 scale for demo
+    _student_population: int
+    # Row index in the owning directory's columns (-1 when standalone)
+    _row: int = field(default=-1, repr=False, compare=False)
+    # Category code, mirrored from the class for direct slot access
+    _cat_code: int = field(default=CAT_UNIVERSITY, repr=False, compare=False)
+    # Lowercased copies, normalized once here so queries never re-lower
+    _name_lower: str = field(default="", repr=False, compare=False)
+    _lga_lower: str = field(default="", repr=False, compare=False)
+    _courses_lower: Tuple[str, ...] = field(default=(), repr=False, compare=False)
+    # Normalized (accreditation, affordability, size) features, fixed at
+    # construction so scoring is just a weighted sum
+    _feat: Tuple[float, float, float] = field(default=(0.0, 0.0, 0.0), repr=False, compare=False)
+    # Memoized composite score (inputs never change after construction)
+    _rank_score: Optional[float] = field(default=None, repr=False, compare=False)
+    # Memoized display line (all of its inputs are immutable too)
+    _line: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._cat_code = self._CAT_CODE
+        self._courses = tuple(self._courses)
+        self._ownership = self._ownership.lower()
+        self._name_lower = self._name.lower()
+        self._lga_lower = self._lga.lower()
+        self._courses_lower = tuple(c.lower() for c in self._courses)
+        # Normalize features to 0–1 once — the divisions (the expensive
+        # FP ops) happen here, not per rank_score() call.
+        # For affordability, lower tuition should mean higher score;
+        # the soft cap avoids division explosions (₦1m scale). Size
+        # prefers moderate to large population.
+        self._feat = (
+            max(0.0, min(1.0, float(self._accreditation_score) / 100.0)),
+            1.0 / (1.0 + float(self._tuition_avg) / 1_000_000.0),
+            min(1.0, int(self._student_population) / 30_000.0),
+        )
+
+    # ---------- ENCAPSULATION (validated properties) ----------
+    @property
+    def name(self) -> str: return self._name
+
+    @property
+    def ownership(self) -> str: return self._ownership
+
+    @property
+    def lga(self) -> str: return self._lga
+
+    @property
+    def courses(self) -> Tuple[str, ...]: return self._courses  # immutable, no copy
+
+    @property
+    def tuition_avg(self) -> float: return float(self._tuition_avg)
+
+    @property
+    def accreditation_score(self) -> float: return float(self._accreditation_score)
+
+    @property
+    def student_population(self) -> int: return int(self._student_population)
+
+    def offers_course(self, course_keyword: str) -> bool:
+        kw = course_keyword.strip().lower()
+        return any(kw in c for c in self._courses_lower)
+
+    # Each subclass pins its category label and code as plain class
+    # attributes: one LOAD_ATTR on the type instead of a property
+    # descriptor + function frame per access. The code is copied onto an
+    # instance slot in __post_init__ so the scoring hot path indexes
+    # _RANK_WEIGHTS without touching the type's MRO.
+    category: ClassVar[str] = ""
+    _CAT_CODE: ClassVar[int] = CAT_UNIVERSITY
+
+    # ---------- POLYMORPHISM (per-type ranking) ----------
+    def rank_score(self) -> float:
+        # Memoized: sort keys and summaries would otherwise redo the
+        # same arithmetic per call. functools.cached_property can't be
+        # used with __slots__, hence the explicit cache field.
+        if self._rank_score is not None:
+            return self._rank_score
+
+        # Weighted sum over the features precomputed in __post_init__.
+        w_acc, w_aff, w_size = _RANK_WEIGHTS[self._cat_code]
+        acc, aff, size = self._feat
+        self._rank_score = (w_acc * acc) + (w_aff * aff) + (w_size * size)
+        return self._rank_score
+
+    # Friendly one-line summary (formatted once, then reused)
+    def line(self) -> str:
+        if self._line is None:
+            self._line = (
+                f"{self.name} [{self.category.title()} | {self.ownership.title()} | {self.lga}] "
+                f"Accr {self.accreditation_score:.0f}/100 • Tuition ₦{self.tuition_avg:,.0f} • "
+                f"Students {self.student_population:,}")
+        return self._line
+
+
+# ---------- INHERITANCE ----------
+class University(BaseInstitution):
+    __slots__ = ()
+    category = "university"
+    _CAT_CODE = CAT_UNIVERSITY
+
+
+class Polytechnic(BaseInstitution):
+    __slots__ = ()
+    category = "polytechnic"
+    _CAT_CODE = CAT_POLYTECHNIC
+
+
+class CollegeOfEducation(BaseInstitution):
+    __slots__ = ()
+    category = "college"
+    _CAT_CODE = CAT_COLLEGE
+
+
+# ---------- Category encoding (SoA codes) ----------
+_CATEGORY_CODES: Dict[str, int] = {
+    "university": CAT_UNIVERSITY,
+    "polytechnic": CAT_POLYTECHNIC,
+    "college": CAT_COLLEGE,
+    "college_of_education": CAT_COLLEGE,
+    "college of education": CAT_COLLEGE,
+}
+
+_CATEGORY_CLASSES: Tuple[type, ...] = (University, Polytechnic, CollegeOfEducation)
+
+# Strict label -> code map for query-side category lookups. The alias
+# table above is for CSV ingest only; filters match the canonical
+# subclass labels exactly, like the baseline `i.category == c` did.
+_CATEGORY_LABEL_CODES: Dict[str, int] = {
+    c.category: c._CAT_CODE for c in _CATEGORY_CLASSES
+}
+
+# Array form of _RANK_WEIGHTS for the vectorized and Numba paths,
+# indexed by category code.
+_RANK_WEIGHT_MATRIX = np.array(_RANK_WEIGHTS)
+
+# Sort keys shared by sort() and top_n_sorted() — attrgetter is a
+# C-implemented callable, so Timsort/heapq pay no Python frame per key.
+_SORT_KEYS = {
+    "tuition": attrgetter("_tuition_avg"),
+    "accreditation": attrgetter("_accreditation_score"),
+    "name": attrgetter("_name_lower"),
+    "population": attrgetter("_student_population"),
+}
+
+
+def _sort_key(by, institutions):
+    if by in _SORT_KEYS:
+        return _SORT_KEYS[by]
+    # Rank (also the fallback for unknown keys): populate the memoized
+    # score once up-front, then read it back via attrgetter.
+    for inst in institutions:
+        inst.rank_score()
+    return attrgetter("_rank_score")
+
+# Expected column order for the fast known-schema CSV parser.
+_CSV_COLUMNS = ("name,category,ownership,lga,courses,"
+                "tuition_avg,accreditation_score,student_population")
+
+# Whole words in course names, for the inverted course index.
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Specialized filter functions, keyed by which of the six filter
+# arguments are active. Generated once per signature via compile/exec —
+# the per-row work is all NumPy, so the win here is dropping the
+# constant is-None branching and dead terms from each query.
+_FILTER_FN_CACHE: Dict[Tuple[bool, ...], object] = {}
+
+
+def _build_filter_fn(active: Tuple[bool, ...]):
+    has_cat, has_own, has_lga, has_kw, has_min, has_max = active
+    lines = [
+        "def _filter_fn(d, category, ownership, lga, course_keyword,"
+        " min_accreditation, max_tuition):",
+        "    mask = np.ones(d._n, dtype=bool)",
+    ]
+    if has_cat:
+        lines.append("    mask &= d._mask_from_rows("
+                     "d._cat_index.get(_CATEGORY_LABEL_CODES.get(category.lower(), -1)))")
+    if has_own:
+        lines.append("    mask &= d._mask_from_rows("
+                     "d._own_index.get(d._own_code_of.get(ownership.lower(), -1)))")
+    if has_lga:
+        lines.append("    mask &= d._mask_from_rows(d._lga_index.get(lga.lower()))")
+    if has_min:
+        lines.append("    mask &= d._accr >= float(min_accreditation)")
+    if has_max:
+        lines.append("    mask &= d._tuition <= float(max_tuition)")
+    if has_kw:
+        if any((has_cat, has_own, has_lga, has_min, has_max)):
+            lines.append("    if not mask.any():")
+            lines.append("        return mask")
+        lines.append("    mask &= d._course_mask(course_keyword)")
+    lines.append("    return mask")
+    ns: Dict[str, object] = {}
+    exec("\n".join(lines),
+         {"np": np, "_CATEGORY_LABEL_CODES": _CATEGORY_LABEL_CODES}, ns)
+    return ns["_filter_fn"]
+
+
+# Below this row count the numpy argsort path wins; JIT dispatch overhead
+# only pays off on larger datasets.
+_JIT_MIN_ROWS = 500
+
+
+def _rank_topn(cat_codes, accr, tuition, pop, mask, n):
+    """
+    Score masked rows and keep the best n via a bounded min-heap —
+    one pass, no full argsort. Written with manual array ops so Numba
+    can lower the whole loop (heapq is off-limits in nopython mode).
+    """
+    W = _RANK_WEIGHT_MATRIX
+    heap_score = np.empty(n, np.float64)
+    heap_row = np.empty(n, np.int64)
+    count = 0
+    for i in range(cat_codes.shape[0]):
+        if not mask[i]:
+            continue
+        c = cat_codes[i]
+        acc = accr[i] / 100.0
+        if acc < 0.0:
+            acc = 0.0
+        elif acc > 1.0:
+            acc = 1.0
+        aff = 1.0 / (1.0 + tuition[i] / 1_000_000.0)
+        size = pop[i] / 30_000.0
+        if size > 1.0:
+            size = 1.0
+        s = W[c, 0] * acc + W[c, 1] * aff + W[c, 2] * size
+        if count < n:
+            # Push: sift the new leaf up.
+            j = count
+            heap_score[j] = s
+            heap_row[j] = i
+            count += 1
+            while j > 0:
+                parent = (j - 1) // 2
+                if heap_score[j] < heap_score[parent]:
+                    heap_score[j], heap_score[parent] = heap_score[parent], heap_score[j]
+                    heap_row[j], heap_row[parent] = heap_row[parent], heap_row[j]
+                    j = parent
+                else:
+                    break
+        elif s > heap_score[0]:
+            # Replace the current minimum and sift down.
+            heap_score[0] = s
+            heap_row[0] = i
+            j = 0
+            while True:
+                left = 2 * j + 1
+                right = left + 1
+                smallest = j
+                if left < count and heap_score[left] < heap_score[smallest]:
+                    smallest = left
+                if right < count and heap_score[right] < heap_score[smallest]:
+                    smallest = right
+                if smallest == j:
+                    break
+                heap_score[j], heap_score[smallest] = heap_score[smallest], heap_score[j]
+                heap_row[j], heap_row[smallest] = heap_row[smallest], heap_row[j]
+                j = smallest
+    order = np.argsort(-heap_score[:count])
+    return heap_row[:count][order]
+
+
+if njit is not None:
+    _rank_topn = njit(cache=True, fastmath=True)(_rank_topn)
+
+
+# ---------- Directory + Algorithms ----------
+class InstitutionDirectory:
+    """
+    Columnar (struct-of-arrays) store over the institution dataset.
+
+    Rows live in parallel NumPy arrays so filtering and ranking run as
+    vectorized operations over contiguous memory; BaseInstitution objects
+    are only materialized on demand (via __getitem__) for display.
+    """
+
+    def __init__(self, institutions: List[BaseInstitution]):
+        # Compatibility path: decompose an existing object list into columns.
+        self._set_columns(
+            names=[i.name for i in institutions],
+            cat_codes=[_CATEGORY_LABEL_CODES[i.category] for i in institutions],
+            ownerships=[i.ownership for i in institutions],
+            lgas=[i.lga for i in institutions],
+            courses=[i.courses for i in institutions],
+            tuition=[i.tuition_avg for i in institutions],
+            accr=[i.accreditation_score for i in institutions],
+            pop=[i.student_population for i in institutions],
+        )
+        self._cache = list(institutions)
+        for row, inst in enumerate(institutions):
+            inst._row = row
+
+    @classmethod
+    def from_csv(cls, path: str, fast_csv: bool = True) -> "InstitutionDirectory":
+        if fast_csv:
+            self = cls._from_csv_fast(path)
+            if self is not None:
+                return self
+        if pd is not None:
+            return cls._from_csv_pandas(path)
+        return cls._from_csv_stdlib(path)
+
+    @classmethod
+    def _from_csv_fast(cls, path: str) -> Optional["InstitutionDirectory"]:
+        """
+        Straight str.split parser for well-formed files in the known
+        column order — one C call per line instead of the csv module's
+        char-by-char state machine. Returns None (caller falls back to a
+        real CSV parser) on a header mismatch, quoted fields, or rows
+        whose field count suggests embedded commas.
+        """
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        if not lines or lines[0].strip() != _CSV_COLUMNS:
+            return None
+        names: List[str] = []
+        cat_codes: List[int] = []
+        ownerships: List[str] = []
+        lgas: List[str] = []
+        courses: List[List[str]] = []
+        tuition: List[float] = []
+        accr: List[float] = []
+        pop: List[int] = []
+        for line in lines[1:]:
+            if not line.strip():
+                continue
+            if '"' in line:
+                return None
+            parts = line.split(",")
+            if len(parts) != 8:
+                return None
+            name, cat, own, lga, courses_str, t, a, p = parts
+            names.append(name.strip())
+            cat_codes.append(_CATEGORY_CODES.get(cat.strip().lower(), CAT_UNIVERSITY))
+            ownerships.append(own.strip().lower())
+            lgas.append(lga.strip())
+            courses.append([c.strip() for c in courses_str.split("|") if c.strip()])
+            tuition.append(float(t) if t.strip() else 0.0)
+            accr.append(float(a) if a.strip() else 0.0)
+            pop.append(int(p) if p.strip() else 0)
+
+        self = cls.__new__(cls)
+        self._set_columns(names, cat_codes, ownerships, lgas, courses, tuition, accr, pop)
+        return self
+
+    @classmethod
+    def _from_csv_pandas(cls, path: str) -> "InstitutionDirectory":
+        # Numeric columns parse in C; empty cells coerce to 0 like the
+        # stdlib path's `or 0` fallbacks.
+        try:
+            df = pd.read_csv(path, keep_default_na=False)
+        except pd.errors.EmptyDataError:
+            # Zero-byte file: no header, no rows — same as stdlib.
+            return cls._from_csv_stdlib(path)
+        names = [n.strip() for n in df["name"].astype(str)]
+        cat_codes = [
+            _CATEGORY_CODES.get(c.strip().lower(), CAT_UNIVERSITY)
+            for c in df["category"].astype(str)
+        ]
+        ownerships = [o.strip().lower() for o in df["ownership"].astype(str)]
+        lgas = [l.strip() for l in df["lga"].astype(str)]
+        courses = [
+            [c.strip() for c in s.split("|") if c.strip()]
+            for s in df["courses"].astype(str)
+        ]
+        tuition = pd.to_numeric(df["tuition_avg"], errors="coerce").fillna(0.0).to_numpy(np.float64)
+        accr = pd.to_numeric(df["accreditation_score"], errors="coerce").fillna(0.0).to_numpy(np.float64)
+        pop = pd.to_numeric(df["student_population"], errors="coerce").fillna(0).to_numpy(np.int64)
+
+        self = cls.__new__(cls)
+        self._set_columns(names, cat_codes, ownerships, lgas, courses, tuition, accr, pop)
+        return self
+
+    @classmethod
+    def _from_csv_stdlib(cls, path: str) -> "InstitutionDirectory":
+        names: List[str] = []
+        cat_codes: List[int] = []
+        ownerships: List[str] = []
+        lgas: List[str] = []
+        courses: List[List[str]] = []
+        tuition: List[float] = []
+        accr: List[float] = []
+        pop: List[int] = []
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            # Positional reader: resolve column indices from the header
+            # once instead of paying DictReader's per-row dict build. A
+            # zero-byte file has no header and yields an empty directory.
+            header = next(reader, None)
+            if header is not None:
+                idx = {h: i for i, h in enumerate(header)}
+                i_name = idx["name"]
+                i_cat = idx["category"]
+                i_own = idx["ownership"]
+                i_lga = idx["lga"]
+                i_courses = idx["courses"]
+                i_tuition = idx["tuition_avg"]
+                i_accr = idx["accreditation_score"]
+                i_pop = idx["student_population"]
+                for row in reader:
+                    if not row:
+                        continue
+                    names.append(row[i_name].strip())
+                    # Default to university if unspecified
+                    cat_codes.append(_CATEGORY_CODES.get(row[i_cat].strip().lower(), CAT_UNIVERSITY))
+                    ownerships.append(row[i_own].strip().lower())
+                    lgas.append(row[i_lga].strip())
+                    courses.append([c.strip() for c in row[i_courses].split("|") if c.strip()])
+                    tuition.append(float(row[i_tuition] or 0.0))
+                    accr.append(float(row[i_accr] or 0.0))
+                    pop.append(int(row[i_pop] or 0))
+
+        self = cls.__new__(cls)
+        self._set_columns(names, cat_codes, ownerships, lgas, courses, tuition, accr, pop)
+        return self
+
+    def _set_columns(
+        self,
+        names: List[str],
+        cat_codes: List[int],
+        ownerships: List[str],
+        lgas: List[str],
+        courses: List[List[str]],
+        tuition: List[float],
+        accr: List[float],
+        pop: List[int],
+    ) -> None:
+        self._n = len(names)
+        self._names = np.asarray(names, dtype=object)
+        self._cat_codes = np.asarray(cat_codes, dtype=np.int8)
+
+        # Ownership values are open-ended in the CSV, so the code table is
+        # built from the data rather than fixed up-front.
+        self._own_code_of: Dict[str, int] = {}
+        self._own_values: List[str] = []
+        own_codes: List[int] = []
+        for own in ownerships:
+            code = self._own_code_of.get(own)
+            if code is None:
+                code = len(self._own_values)
+                self._own_code_of[own] = code
+                self._own_values.append(own)
+            own_codes.append(code)
+        self._own_codes = np.asarray(own_codes, dtype=np.int8)
+
+        self._lgas = np.asarray(lgas, dtype=object)
+        self._lgas_lower = np.asarray([l.lower() for l in lgas], dtype=object)
+
+        # Postings per categorical value: row ids precomputed once, so a
+        # category/ownership/LGA filter is a dict hit instead of an
+        # equality scan.
+        self._cat_index: Dict[int, np.ndarray] = {
+            int(code): np.flatnonzero(self._cat_codes == code)
+            for code in np.unique(self._cat_codes)
+        }
+        self._own_index: Dict[int, np.ndarray] = {
+            code: np.flatnonzero(self._own_codes == code)
+            for code in self._own_code_of.values()
+        }
+        lga_rows: Dict[str, List[int]] = {}
+        for row, lg in enumerate(self._lgas_lower):
+            lga_rows.setdefault(lg, []).append(row)
+        self._lga_index: Dict[str, np.ndarray] = {
+            lg: np.asarray(rows, dtype=np.int64) for lg, rows in lga_rows.items()
+        }
+        self._courses: List[Tuple[str, ...]] = [tuple(cs) for cs in courses]
+        # One lowercased pipe-joined blob per row for substring search in
+        # C. dtype is explicit so a zero-row directory still gets a
+        # string array (inference would pick float64 and break the sweep).
+        self._course_blobs = np.asarray(["|".join(cs).lower() for cs in courses],
+                                        dtype=np.str_)
+        # Inverted index: whole-word course token -> row ids. Tokenized
+        # once at load so keyword queries become a dict lookup. A token
+        # only qualifies for the shortcut if it is not a substring of any
+        # other token — otherwise the posting list would miss rows where
+        # the keyword sits inside a longer word (e.g. "science" in
+        # "Neuroscience") and the shortcut would change query results,
+        # not just speed them up.
+        postings: Dict[str, List[int]] = {}
+        for row, blob in enumerate(self._course_blobs):
+            for token in set(_TOKEN_RE.findall(blob)):
+                postings.setdefault(token, []).append(row)
+        self._course_token_rows: Dict[str, np.ndarray] = {
+            token: np.asarray(rows, dtype=np.int64)
+            for token, rows in postings.items()
+            if not any(token in other for other in postings if other != token)
+        }
+        self._tuition = np.asarray(tuition, dtype=np.float64)
+        self._accr = np.asarray(accr, dtype=np.float64)
+        self._pop = np.asarray(pop, dtype=np.int64)
+        self._cache: List[Optional[BaseInstitution]] = [None] * self._n
+        self._scores: Optional[np.ndarray] = None
+        # Lazily cached stable argsort permutation per (key, direction).
+        self._orders: Dict[Tuple[str, bool], np.ndarray] = {}
+
+    def rank_scores_all(self) -> np.ndarray:
+        """Composite rank scores for every row, as one NumPy expression."""
+        if self._scores is None:
+            w = _RANK_WEIGHT_MATRIX[self._cat_codes]          # (N, 3)
+            acc = np.clip(self._accr / 100.0, 0.0, 1.0)
+            aff = 1.0 / (1.0 + self._tuition / 1_000_000.0)
+            size = np.minimum(1.0, self._pop / 30_000.0)
+            self._scores = w[:, 0] * acc + w[:, 1] * aff + w[:, 2] * size
+        return self._scores
+
+    def top_rank_rows(self, mask: np.ndarray, n: int) -> np.ndarray:
+        """Row indices of the n best-ranked rows under mask, best first."""
+        n = min(max(0, n), self._n)
+        if n == 0:
+            return np.empty(0, dtype=np.int64)
+        if njit is not None and self._n >= _JIT_MIN_ROWS:
+            return _rank_topn(self._cat_codes, self._accr, self._tuition,
+                              self._pop, mask, n)
+        return self._sorted_rows(mask, "rank", descending=True, n=n)
+
+    def _order_for(self, by: str, descending: bool) -> np.ndarray:
+        """Stable argsort permutation per (key, direction), computed once."""
+        key = (by, descending)
+        order = self._orders.get(key)
+        if order is None:
+            col = {
+                "tuition": self._tuition,
+                "accreditation": self._accr,
+                "population": self._pop,
+                "name": np.asarray([n.lower() for n in self._names], dtype=object),
+            }.get(by)
+            if col is None:
+                col = self.rank_scores_all()
+            if descending:
+                # Stable descending: argsort the reversed column and map
+                # the indices back, so equal keys keep file order like
+                # sorted(reverse=True) — plain order[::-1] would flip
+                # ties. Works for string columns too, unlike negation.
+                order = (self._n - 1) - np.argsort(col[::-1], kind="stable")[::-1]
+            else:
+                order = np.argsort(col, kind="stable")
+            self._orders[key] = order
+        return order
+
+    def _sorted_rows(
+        self,
+        mask: np.ndarray,
+        by: str,
+        descending: bool,
+        n: Optional[int] = None,
+    ) -> np.ndarray:
+        # Mask-then-gather over the cached permutation: O(N) instead of
+        # re-sorting per query.
+        order = self._order_for(by, descending)
+        hits = np.flatnonzero(mask[order])
+        if n is not None:
+            hits = hits[:n]
+        return order[hits]
+
+    def _score_of(self, inst: BaseInstitution) -> float:
+        if inst._row >= 0:
+            return float(self.rank_scores_all()[inst._row])
+        return inst.rank_score()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, idx: int) -> BaseInstitution:
+        # Materialize (and memoize) a row as its institution object.
+        inst = self._cache[idx]
+        if inst is None:
+            cls_ = _CATEGORY_CLASSES[self._cat_codes[idx]]
+            inst = cls_(
+                self._names[idx],
+                self._own_values[self._own_codes[idx]],
+                self._lgas[idx],
+                self._courses[idx],
+                float(self._tuition[idx]),
+                float(self._accr[idx]),
+                int(self._pop[idx]),
+                _row=idx,
+            )
+            self._cache[idx] = inst
+        return inst
+
+    def _rows(self, mask: np.ndarray) -> List[BaseInstitution]:
+        return [self[i] for i in np.flatnonzero(mask)]
+
+    def _owns_rows(self, institutions: List[BaseInstitution], rows: List[int]) -> bool:
+        # The gather paths work on a set-like row mask over this
+        # directory's columns, so every element must be a distinct row
+        # materialized by *this* directory — a row index carried over
+        # from another directory would silently return that directory's
+        # data, and repeats would be collapsed by the mask.
+        if len(set(rows)) != len(rows):
+            return False
+        cache = self._cache
+        n = self._n
+        return all(0 <= r < n and cache[r] is inst
+                   for inst, r in zip(institutions, rows))
+
+    def _mask_from_rows(self, rows: Optional[np.ndarray]) -> np.ndarray:
+        mask = np.zeros(self._n, dtype=bool)
+        if rows is not None:
+            mask[rows] = True
+        return mask
+
+    def _course_mask(self, course_keyword: str) -> np.ndarray:
+        kw = course_keyword.strip().lower()
+        if "|" in kw:
+            # No single course can contain the join character (courses
+            # were split on it), and a match spanning the boundary would
+            # be a false positive the baseline never produced.
+            return np.zeros(self._n, dtype=bool)
+        rows = self._course_token_rows.get(kw)
+        if rows is not None:
+            # Keyword is an indexed whole word (and provably not part of
+            # a longer one): O(1) posting-list lookup.
+            return self._mask_from_rows(rows)
+        # Partial / multi-word keyword: substring sweep over the blobs.
+        return np.char.find(self._course_blobs, kw) >= 0
+
+    # ------- Filtering & search (vectorized masks) -------
+    def filter(
+        self,
+        category: Optional[str] = None,
+        ownership: Optional[str] = None,
+        lga: Optional[str] = None,
+        course_keyword: Optional[str] = None,
+        min_accreditation: Optional[float] = None,
+        max_tuition: Optional[float] = None,
+    ) -> List[BaseInstitution]:
+        # Dispatch to a mask function specialized for exactly the active
+        # filters: categorical terms resolve through precomputed
+        # postings, the course sweep goes last behind an early exit, and
+        # inactive terms simply don't appear in the generated code.
+        active = (bool(category), bool(ownership), bool(lga), bool(course_keyword),
+                  min_accreditation is not None, max_tuition is not None)
+        fn = _FILTER_FN_CACHE.get(active)
+        if fn is None:
+            fn = _FILTER_FN_CACHE[active] = _build_filter_fn(active)
+        mask = fn(self, category, ownership, lga, course_keyword,
+                  min_accreditation, max_tuition)
+        return self._rows(mask)
+
+    def sort(
+        self,
+        institutions: List[BaseInstitution],
+        by: str = "rank",
+        descending: bool = True
+    ) -> List[BaseInstitution]:
+        rows = [i._row for i in institutions]
+        if self._owns_rows(institutions, rows):
+            mask = self._mask_from_rows(np.asarray(rows, dtype=np.int64))
+            return [self[r] for r in self._sorted_rows(mask, by, descending)]
+        # Repeats, standalone objects, or rows from another directory:
+        # full sorted() semantics.
+        return sorted(institutions, key=_sort_key(by, institutions), reverse=descending)
+
+    def top_n(self, institutions: List[BaseInstitution], n: int = 5) -> List[BaseInstitution]:
+        return institutions[:max(0, n)]
+
+    def top_n_sorted(
+        self,
+        institutions: List[BaseInstitution],
+        by: str = "rank",
+        n: int = 5,
+        descending: bool = True
+    ) -> List[BaseInstitution]:
+        """Top n under the given sort key without fully sorting the list."""
+        n = max(0, n)
+        if n == 0:
+            return []
+        rows = [i._row for i in institutions]
+        if self._owns_rows(institutions, rows):
+            mask = self._mask_from_rows(np.asarray(rows, dtype=np.int64))
+            n = min(n, len(institutions))
+            if by == "rank" and descending:
+                top = self.top_rank_rows(mask, n)
+            else:
+                top = self._sorted_rows(mask, by, descending, n)
+            return [self[r] for r in top]
+        if by == "name" or n >= len(institutions):
+            # Timsort on strings is cheap, and tiny lists aren't worth a heap.
+            return self.sort(institutions, by=by, descending=descending)[:n]
+        pick = heapq.nlargest if descending else heapq.nsmallest
+        return pick(n, institutions, key=_sort_key(by, institutions))  # O(N log n)
+
+    def summarize(self, institutions: List[BaseInstitution]) -> str:
+        if not institutions:
+            return "No institutions matched your criteria."
+        lines = []
+        for i, inst in enumerate(institutions, 1):
+            lines.append(f"{i:>2}. {inst.line()} • RankScore {self._score_of(inst):.3f}")
+        return "\n".join(lines)
+
+
+# ---------- CLI ----------
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Lagos Tertiary Institution Directory (Search & Rank)")
+    p.add_argument("--csv", type=str, default="institutions_sample.csv", help="Path to CSV dataset")
+
+    # Filters
+    p.add_argument("--category", type=str, choices=["university", "polytechnic", "college"], help="Filter by category")
+    p.add_argument("--ownership", type=str, choices=["federal", "state", "private"], help="Filter by ownership")
+    p.add_argument("--lga", type=str, help="Filter by LGA (e.g., Ojo, Yaba, Ikeja)")
+    p.add_argument("--course", type=str, help="Keyword in course name (e.g., 'Computer')")
+    p.add_argument("--min-accr", type=float, help="Minimum accreditation score (0–100)")
+    p.add_argument("--max-tuition", type=float, help="Maximum average tuition (₦)")
+
+    # Sorting & output
+    p.add_argument("--sort-by", type=str, default="rank",
+                   choices=["rank", "tuition", "accreditation", "name", "population"],
+                   help="Sort key")
+    p.add_argument("--asc", action="store_true", help="Sort ascending (default: descending)")
+    p.add_argument("--top", type=int, default=5, help="Show top N results")
+    return p
+
+
+def main():
+    args = build_parser().parse_args()
+    directory = InstitutionDirectory.from_csv(args.csv)
+
+    filtered = directory.filter(
+        category=args.category,
+        ownership=args.ownership,
+        lga=args.lga,
+        course_keyword=args.course,
+        min_accreditation=args.min_accr,
+        max_tuition=args.max_tuition
+    )
+    top = directory.top_n_sorted(filtered, by=args.sort_by, n=args.top, descending=not args.asc)
+
+    print("\n=== Lagos Tertiary Institution Directory — Results ===\n")
+    print(directory.summarize(top))
+    print("\nTip: adjust filters, e.g., --category university --course Computer --max-tuition 400000 --sort-by accreditation --top 10\n")
+
+
+if __name__ == "__main__":
+    main()
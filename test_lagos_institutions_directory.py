@@ -1,3 +1,6 @@
+from itertools import product
+
+import lagos_institutions_directory
 from lagos_institutions_directory import InstitutionDirectory
 
 def load_dir():
@@ -20,6 +23,154 @@ def test_sort_by_accreditation_desc():
     data = d.sort(d.filter(), by="accreditation", descending=True)
     assert data == sorted(data, key=lambda x: x.accreditation_score, reverse=True)
 
+def test_filter_category_requires_exact_label():
+    d = load_dir()
+    # CSV aliases are ingest-only; query labels match the canonical three
+    assert d.filter(category="college_of_education") == []
+    assert len(d.filter(category="college")) == 2
+
+
+def test_course_keyword_matches_inside_longer_words(tmp_path):
+    path = tmp_path / "sub.csv"
+    path.write_text(
+        "name,category,ownership,lga,courses,"
+        "tuition_avg,accreditation_score,student_population\n"
+        "A,university,state,Yaba,Computer Science,100,50,1000\n"
+        "B,university,state,Yaba,Neuroscience,100,50,1000\n"
+    )
+    d = InstitutionDirectory.from_csv(str(path))
+    # Substring semantics: "science" also matches inside "Neuroscience"
+    assert len(d.filter(course_keyword="science")) == 2
+    assert len(d.filter(course_keyword="neuroscience")) == 1
+
+
+def test_course_keyword_does_not_match_across_courses():
+    d = load_dir()
+    # "science|mass" only occurs across the boundary between two courses
+    assert d.filter(course_keyword="science|mass") == []
+
+
+def test_empty_csv_filters_cleanly(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("name,category,ownership,lga,courses,"
+                    "tuition_avg,accreditation_score,student_population\n")
+    d = InstitutionDirectory.from_csv(str(path))
+    assert len(d) == 0
+    assert d.filter(course_keyword="computer") == []
+    assert d.filter(category="university", min_accreditation=50) == []
+
+
+def test_zero_byte_csv_loads_empty(tmp_path, monkeypatch):
+    path = tmp_path / "zero.csv"
+    path.write_text("")
+    assert len(InstitutionDirectory.from_csv(str(path))) == 0    # pandas path
+    monkeypatch.setattr(lagos_institutions_directory, "pd", None)
+    assert len(InstitutionDirectory.from_csv(str(path))) == 0    # stdlib path
+
+
+def test_sort_preserves_duplicates():
+    d = load_dir()
+    a, b = d.filter()[:2]
+    out = d.sort([a, b, a], by="tuition", descending=True)
+    assert len(out) == 3
+    assert out == sorted([a, b, a], key=lambda x: x.tuition_avg, reverse=True)
+    assert len(d.top_n_sorted([a, b, a], by="rank", n=3)) == 3
+
+
+def test_filter_matches_per_object_reference():
+    d = load_dir()
+    everything = d.filter()
+
+    def reference(**kw):
+        out = []
+        for x in everything:
+            if kw.get("category") and x.category != kw["category"].lower():
+                continue
+            if kw.get("ownership") and x.ownership != kw["ownership"].lower():
+                continue
+            if kw.get("lga") and x.lga.lower() != kw["lga"].lower():
+                continue
+            if kw.get("course_keyword") and not x.offers_course(kw["course_keyword"]):
+                continue
+            if kw.get("min_accreditation") is not None and x.accreditation_score < kw["min_accreditation"]:
+                continue
+            if kw.get("max_tuition") is not None and x.tuition_avg > kw["max_tuition"]:
+                continue
+            out.append(x.name)
+        return out
+
+    vals = dict(category="university", ownership="state", lga="Yaba",
+                course_keyword="computer", min_accreditation=75, max_tuition=500000)
+    # Every combination of active filters, i.e. all 64 generated signatures
+    for bits in product((False, True), repeat=len(vals)):
+        kw = {k: v for (k, v), b in zip(vals.items(), bits) if b}
+        assert [i.name for i in d.filter(**kw)] == reference(**kw), kw
+
+
+def test_fast_csv_falls_back_on_quoted_input(tmp_path):
+    path = tmp_path / "quoted.csv"
+    path.write_text(
+        "name,category,ownership,lga,courses,"
+        "tuition_avg,accreditation_score,student_population\n"
+        '"Lagos City Polytechnic, Main Campus",polytechnic,private,Ikeja,'
+        "Computer Technology,200000,70,8000\n"
+    )
+    d = InstitutionDirectory.from_csv(str(path))
+    assert len(d) == 1
+    assert d[0].name == "Lagos City Polytechnic, Main Campus"
+    assert d[0].tuition_avg == 200000
+
+
+def test_csv_loader_paths_agree(monkeypatch):
+    base = load_dir()  # fast str.split path
+    others = [InstitutionDirectory.from_csv("institutions_sample.csv", fast_csv=False)]
+    monkeypatch.setattr(lagos_institutions_directory, "pd", None)
+    others.append(InstitutionDirectory.from_csv("institutions_sample.csv", fast_csv=False))
+    for d in others:
+        assert len(d) == len(base)
+        assert [d[i].name for i in range(len(d))] == [base[i].name for i in range(len(base))]
+        assert (d._tuition == base._tuition).all()
+        assert (d._cat_codes == base._cat_codes).all()
+        assert d._courses == base._courses
+
+
+def test_descending_sort_keeps_tie_order(tmp_path):
+    path = tmp_path / "ties.csv"
+    path.write_text(
+        "name,category,ownership,lga,courses,"
+        "tuition_avg,accreditation_score,student_population\n"
+        "A,university,state,Yaba,Law,100,50,1000\n"
+        "B,university,state,Yaba,Law,100,60,2000\n"
+        "C,university,state,Yaba,Law,100,70,3000\n"
+    )
+    d = InstitutionDirectory.from_csv(str(path))
+    a, b, c = d.filter()
+    # Equal keys keep input order in both directions, like sorted()
+    assert [i.name for i in d.sort([a, b, c], by="tuition", descending=True)] == ["A", "B", "C"]
+    assert [i.name for i in d.sort([a, b, c], by="tuition", descending=False)] == ["A", "B", "C"]
+    # ...and the gather and sorted() fallback paths agree on tie order
+    assert [i.name for i in d.sort([a, b, c, a], by="tuition", descending=True)] == ["A", "B", "C", "A"]
+    assert [i.name for i in d.top_n_sorted([a, b, c], by="tuition", n=2, descending=True)] == ["A", "B"]
+
+
+def test_sort_with_rows_from_another_directory(tmp_path):
+    d1 = load_dir()
+    path = tmp_path / "other.csv"
+    path.write_text(
+        "name,category,ownership,lga,courses,"
+        "tuition_avg,accreditation_score,student_population\n"
+        "Other A,university,state,Ikeja,Law,100,50,1000\n"
+        "Other B,university,state,Ikeja,Law,200,60,2000\n"
+    )
+    d2 = InstitutionDirectory.from_csv(str(path))
+    picked = d1.filter(ownership="private")
+    # d2 must sort the objects it was given, not its own rows
+    out = d2.sort(picked, by="tuition", descending=True)
+    assert out == sorted(picked, key=lambda x: x.tuition_avg, reverse=True)
+    top = d2.top_n_sorted(picked, by="tuition", n=1, descending=True)
+    assert top == out[:1]
+
+
 def test_rank_score_monotonicity():
     d = load_dir()
     ranked = d.sort(d.filter(), by="rank", descending=True)